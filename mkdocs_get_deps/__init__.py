@@ -2,14 +2,14 @@ from __future__ import annotations
 
 __version__ = "0.2.0"
 
+import concurrent.futures
 import dataclasses
 import datetime
-import functools
 import io
 import logging
+import mmap
 import os
 import sys
-import urllib.parse
 from typing import IO, Any, BinaryIO, Collection, Mapping, Sequence
 
 import yaml
@@ -32,47 +32,60 @@ BUILTIN_EXTENSIONS = {
 _NotFound = ()
 
 
-def _dig(cfg, keys: str):
+def _dig(cfg: Any, keys: str) -> Any:
     """
     Receives a string such as 'foo.bar' and returns `cfg['foo']['bar']`, or `_NotFound`.
 
     A list of single-item dicts gets converted to a flat dict. This is intended for `plugins` config.
     """
-    key, _, rest = keys.partition(".")
-    try:
-        cfg = cfg[key]
-    except (KeyError, TypeError):
-        return _NotFound
-    if isinstance(cfg, list):
-        orig_cfg = cfg
-        cfg = {}
-        for item in reversed(orig_cfg):
-            if isinstance(item, dict) and len(item) == 1:
-                cfg.update(item)
-            elif isinstance(item, str):
-                cfg[item] = {}
-    if not rest:
-        return cfg
-    return _dig(cfg, rest)
-
-
-def _strings(obj) -> Sequence[str]:
-    if isinstance(obj, str):
-        return (obj,)
-    else:
-        return tuple(obj)
+    for key in keys.split("."):
+        try:
+            cfg = cfg[key]
+        except (KeyError, TypeError):
+            return _NotFound
+        if isinstance(cfg, list):
+            orig_cfg = cfg
+            cfg = {}
+            for item in reversed(orig_cfg):
+                if isinstance(item, dict) and len(item) == 1:
+                    for k, v in item.items():
+                        # Interned names make the repeated set/dict lookups later
+                        # short-circuit on pointer equality.
+                        cfg[sys.intern(k) if isinstance(k, str) else k] = v
+                elif isinstance(item, str):
+                    cfg[sys.intern(item)] = {}
+    return cfg
+
+
+def _strings(obj: Any) -> Sequence[str]:
+    # Exact type checks: YAML only ever produces plain `str`, and a `tuple` (such as the
+    # `()` default) is already normalized - returning it as-is saves an allocation.
+    if type(obj) is str:
+        return (sys.intern(obj),)
+    if type(obj) is tuple:
+        return obj
+    return tuple(sys.intern(s) if isinstance(s, str) else s for s in obj)
+
+
+_ENTRY_POINT_GROUPS = ("mkdocs.themes", "mkdocs.plugins", "markdown.extensions")
+
+_entry_points_cache: dict[str, Mapping[str, Any]] = {}
 
 
-@functools.lru_cache(maxsize=None)
 def _entry_points(group: str) -> Mapping[str, Any]:
-    if sys.version_info >= (3, 10):
-        from importlib.metadata import entry_points
-    else:
-        from importlib_metadata import entry_points
+    if not _entry_points_cache:
+        if sys.version_info >= (3, 10):
+            from importlib.metadata import entry_points
+        else:
+            from importlib_metadata import entry_points
 
-    eps = {ep.name: ep for ep in entry_points(group=group)}
-    log.debug(f"Available '{group}' entry points: {sorted(eps)}")
-    return eps
+        # A single scan of the installed distributions covers all groups of interest.
+        all_eps = entry_points()
+        for known_group in _ENTRY_POINT_GROUPS:
+            eps = {ep.name: ep for ep in all_eps.select(group=known_group)}
+            log.debug(f"Available '{known_group}' entry points: {sorted(eps)}")
+            _entry_points_cache[known_group] = eps
+    return _entry_points_cache[group]
 
 
 @dataclasses.dataclass(frozen=True)
@@ -84,33 +97,77 @@ class _PluginKind:
         return self.projects_key.rpartition("_")[-1]
 
 
+def _open_local(path: str) -> BinaryIO:
+    # Memory-map the file when possible, so the YAML loader consumes the kernel's page
+    # cache directly instead of an in-memory copy of the whole file.
+    f = open(path, "rb")
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # Empty files and exotic filesystems can't be mapped.
+        return f
+    f.close()
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+        mapped.madvise(mmap.MADV_WILLNEED)
+    return mapped  # type: ignore[return-value]
+
+
 def get_projects_file(path: str | None = None) -> BinaryIO:
     if path is None:
         path = DEFAULT_PROJECTS_FILE
-    if urllib.parse.urlsplit(path).scheme in ("http", "https"):
+    if path.startswith(("http://", "https://")):
+        # The cache layer already holds the content in memory.
+        return io.BytesIO(cache.download_and_cache_url(path, datetime.timedelta(days=1)))
+    return _open_local(path)
+
+
+def _parse_projects(content: bytes) -> Sequence[Mapping[str, Any]]:
+    return yaml.load(content, Loader=yaml_util.CatalogLoader)["projects"]
+
+
+def get_projects(path: str | None = None) -> Sequence[Mapping[str, Any]]:
+    """Return the list of known MkDocs-related projects, parsed from the registry file.
+
+    For the default (downloaded) registry, both the download and the parse result are cached,
+    so repeated invocations don't re-pay the YAML parse cost.
+    """
+    if path is None:
+        path = DEFAULT_PROJECTS_FILE
+    if path.startswith(("http://", "https://")):
         content = cache.download_and_cache_url(path, datetime.timedelta(days=1))
-    else:
-        with open(path, "rb") as f:
-            content = f.read()
-    return io.BytesIO(content)
+        return cache.parse_and_cache(path, content, _parse_projects)
+    with _open_local(path) as f:
+        return yaml.load(f, Loader=yaml_util.CatalogLoader)["projects"]
 
 
 def get_deps(
     config_file: IO | os.PathLike | str | None = None,
-    projects_file: IO | None = None,
+    projects_file: IO | str | None = None,
 ) -> Collection[str]:
     """
     Print PyPI package dependencies inferred from a mkdocs.yml file based on a reverse mapping of known projects.
 
     Args:
         config_file: Non-default mkdocs.yml file - content as a buffer, or path.
-        projects_file: File/buffer that declares all known MkDocs-related projects.
+        projects_file: File/buffer, or URL/path, that declares all known MkDocs-related projects.
             The file is in YAML format and contains `projects: [{mkdocs_theme:, mkdocs_plugin:, markdown_extension:}]
     """
+    projects_future = None
+    opened_projects_file: IO | None = None
+    if projects_file is None or isinstance(projects_file, str):
+        # Kick off the registry fetch in the background, so a network round-trip
+        # overlaps with the local config parsing below instead of following it.
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        projects_future = executor.submit(get_projects, projects_file)
+        executor.shutdown(wait=False)
+    else:
+        opened_projects_file = projects_file
+
     if config_file is None:
-        if os.path.isfile("mkdocs.yml"):
-            config_file = "mkdocs.yml"
-        elif os.path.isfile("mkdocs.yaml"):
+        # One scandir call checks for both candidate files in a single syscall.
+        with os.scandir() as dir_entries:
+            names = {entry.name for entry in dir_entries if entry.is_file()}
+        if "mkdocs.yml" not in names and "mkdocs.yaml" in names:
             config_file = "mkdocs.yaml"
         else:
             config_file = "mkdocs.yml"
@@ -129,15 +186,27 @@ def get_deps(
             f"The configuration is invalid. Expected a key-value mapping but received {type(cfg)}"
         )
 
-    packages_to_install = set()
+    # A dict rather than a set: it deduplicates just the same, without hashing into
+    # a separate table, and `sorted()` iterates its keys directly at the end.
+    packages_to_install: dict[str, None] = {}
+
+    dig_cache: dict[str, Any] = {}
+
+    def dig(keys: str) -> Any:
+        # Memoized `_dig` into the config, so repeated lookups flatten each subtree only once.
+        try:
+            return dig_cache[keys]
+        except KeyError:
+            result = dig_cache[keys] = _dig(cfg, keys)
+            return result
 
     if all(c not in cfg for c in ("site_name", "theme", "plugins", "markdown_extensions")):
         log.warning(f"The file {config_file!r} doesn't seem to be a mkdocs.yml config file")
     else:
-        if _dig(cfg, "theme.locale") not in (_NotFound, "en"):
-            packages_to_install.add("mkdocs[i18n]")
+        if dig("theme.locale") not in (_NotFound, "en"):
+            packages_to_install["mkdocs[i18n]"] = None
         else:
-            packages_to_install.add("mkdocs")
+            packages_to_install["mkdocs"] = None
 
     try:
         theme = cfg["theme"]["name"]
@@ -145,8 +214,8 @@ def get_deps(
         theme = cfg.get("theme")
     themes = {theme} if theme else set()
 
-    plugins = set(_strings(_dig(cfg, "plugins")))
-    extensions = set(_strings(_dig(cfg, "markdown_extensions")))
+    plugins = set(_strings(dig("plugins")))
+    extensions = set(_strings(dig("markdown_extensions")))
 
     wanted_plugins = (
         (_PluginKind("mkdocs_theme", "mkdocs.themes"), themes - BUILTIN_THEMES),
@@ -156,45 +225,79 @@ def get_deps(
     for kind, wanted in wanted_plugins:
         log.debug(f"Wanted {kind}s: {sorted(wanted)}")
 
-    if projects_file is None:
-        projects_file = get_projects_file()
-    with projects_file:
-        projects = yaml.load(projects_file, Loader=yaml_util.SafeLoader)["projects"]
-
+    if not any(wanted for _, wanted in wanted_plugins):
+        # Everything is builtin - no need to consult (or even fetch) the registry at all.
+        if projects_future is not None:
+            projects_future.cancel()
+        if opened_projects_file is not None:
+            opened_projects_file.close()  # This function owns the passed file either way.
+        return sorted(packages_to_install)
+
+    if opened_projects_file is not None:
+        with opened_projects_file:
+            projects = yaml.load(opened_projects_file, Loader=yaml_util.CatalogLoader)["projects"]
+    else:
+        assert projects_future is not None
+        projects = projects_future.result()
+
+    # Build a reverse index over the catalog: entry name -> its providers in catalog order,
+    # each recorded along with the catalog entry name it came from.
+    # This way the lookups below cost O(wanted) instead of a scan over the whole catalog.
+    theme_prefix = f"{theme}/" if theme is not None else None
+    index: dict[str, dict[str, list[tuple[str, Mapping[str, Any]]]]] = {
+        kind.projects_key: {} for kind, _ in wanted_plugins
+    }
     for project in projects:
-        for kind, wanted in wanted_plugins:
-            available = _strings(project.get(kind.projects_key, ()))
-            for entry_name in available:
-                if (  # Also check theme-namespaced plugin names against the current theme.
-                    "/" in entry_name
-                    and theme is not None
-                    and kind.projects_key == "mkdocs_plugin"
-                    and entry_name.startswith(f"{theme}/")
-                    and entry_name[len(theme) + 1 :] in wanted
-                    and entry_name not in wanted
-                ):
-                    entry_name = entry_name[len(theme) + 1 :]
-                if entry_name in wanted:
-                    if "pypi_id" in project:
-                        install_name = project["pypi_id"]
-                    elif "github_id" in project:
-                        install_name = "git+https://github.com/{github_id}".format_map(project)
-                    else:
-                        log.error(
-                            f"Can't find how to install {kind} '{entry_name}' although it was identified as {project}"
-                        )
-                        continue
-                    packages_to_install.add(install_name)
-                    for extra_key, extra_pkgs in project.get("extra_dependencies", {}).items():
-                        if _dig(cfg, extra_key) is not _NotFound:
-                            packages_to_install.update(_strings(extra_pkgs))
-
-                    wanted.remove(entry_name)
+        for projects_key, entries in index.items():
+            namespace_prefix = theme_prefix if projects_key == "mkdocs_plugin" else None
+            for entry_name in _strings(project.get(projects_key, ())):
+                entries.setdefault(entry_name, []).append((entry_name, project))
+                # Also register theme-namespaced plugin names under their plain name,
+                # so they match against the current theme. Appending in catalog order
+                # keeps the precedence between an alias and a same-named plain entry.
+                if namespace_prefix is not None and entry_name.startswith(namespace_prefix):
+                    entries.setdefault(entry_name[len(namespace_prefix) :], []).append(
+                        (entry_name, project)
+                    )
+
+    for kind, wanted in wanted_plugins:
+        entries = index[kind.projects_key]
+        initially_wanted = frozenset(wanted)
+        # Bulk-match with a single set intersection.
+        for entry_name in wanted & entries.keys():
+            for source_name, project in entries[entry_name]:
+                # A namespaced alias may only satisfy the plain name if the namespaced
+                # name isn't itself wanted - in that case it satisfies only the latter.
+                if source_name != entry_name and source_name in initially_wanted:
+                    continue
+                if "pypi_id" in project:
+                    install_name = project["pypi_id"]
+                elif "github_id" in project:
+                    install_name = "git+https://github.com/{github_id}".format_map(project)
+                else:
+                    log.error(
+                        f"Can't find how to install {kind} '{entry_name}' although it was identified as {project}"
+                    )
+                    continue  # Fall through to the next provider of this name, if any.
+                packages_to_install[install_name] = None
+                extra_dependencies = project.get("extra_dependencies")
+                if extra_dependencies:
+                    for extra_key, extra_pkgs in extra_dependencies.items():
+                        if dig(extra_key) is not _NotFound:
+                            packages_to_install.update(dict.fromkeys(_strings(extra_pkgs)))
+
+                wanted.remove(entry_name)
+                break
 
     for kind, wanted in wanted_plugins:
+        if not wanted:
+            # All names were matched - don't touch the entry points (and their costly
+            # scan of installed distributions) at all.
+            continue
+        entry_points = _entry_points(kind.entry_points_key)
         for entry_name in sorted(wanted):
             dist_name = None
-            ep = _entry_points(kind.entry_points_key).get(entry_name)
+            ep = entry_points.get(entry_name)
             if ep is not None and ep.dist is not None:
                 dist_name = ep.dist.name
             warning = (
@@ -4,7 +4,7 @@ import argparse
 import logging
 import sys
 
-from . import get_deps, get_projects_file
+from . import get_deps
 
 parser = argparse.ArgumentParser(
     description="Show required PyPI packages inferred from plugins in mkdocs.yml."
@@ -47,8 +47,7 @@ def cli():
     warning_counter.setLevel(logging.WARNING)
     logging.getLogger("mkdocs").addHandler(warning_counter)
 
-    with get_projects_file(args.projects_file) as projects_file:
-        deps = get_deps(config_file=args.config_file, projects_file=projects_file)
+    deps = get_deps(config_file=args.config_file, projects_file=args.projects_file)
 
     for dep in deps:
         print(dep)  # noqa: T201
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import datetime
 import hashlib
+import json
 import logging
 import os
+import pickle
 import random
+import urllib.error
 import urllib.request
-from typing import Callable
+from typing import Any, Callable, Mapping
 
 import platformdirs
 
@@ -15,35 +18,43 @@ from . import __version__
 log = logging.getLogger(f"mkdocs.{__name__}")
 
 
-def _download_url(url: str) -> bytes:
-    req = urllib.request.Request(url, headers={"User-Agent": f"mkdocs-get-deps/{__version__}"})
+def _download_url(url: str, headers: Mapping[str, str]) -> tuple[bytes, Mapping[str, str]]:
+    req = urllib.request.Request(
+        url, headers={"User-Agent": f"mkdocs-get-deps/{__version__}", **headers}
+    )
     with urllib.request.urlopen(req) as resp:
-        return resp.read()
+        return resp.read(), resp.headers
 
 
 def download_and_cache_url(
     url: str,
     cache_duration: datetime.timedelta,
     *,
-    download: Callable[[str], bytes] = _download_url,
+    download: Callable[[str, Mapping[str, str]], tuple[bytes, Mapping[str, str]]] = _download_url,
     comment: bytes = b"# ",
 ) -> bytes:
     """Downloads a file from the URL, stores it under ~/.cache/, and returns its content.
 
     For tracking the age of the content, a prefix is inserted into the stored file, rather than relying on mtime.
 
+    Once the cached content expires, it is revalidated with the `ETag`/`Last-Modified` response
+    headers (kept in a sidecar file), so an unchanged file is never re-downloaded.
+
     Args:
         url: URL to use.
-        download: Callback that will accept the URL and actually perform the download.
+        download: Callback that will accept the URL and request headers, actually perform the
+            download, and return the content along with the response headers.
         cache_duration: How long to consider the URL content cached.
         comment: The appropriate comment prefix for this file format.
     """
     directory = os.path.join(platformdirs.user_cache_dir("mkdocs"), "mkdocs_url_cache")
     name_hash = hashlib.sha256(url.encode()).hexdigest()[:32]
     path = os.path.join(directory, name_hash + os.path.splitext(url)[1])
+    headers_path = path + ".headers"
 
     now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
     prefix = b"%s%s downloaded at timestamp " % (comment, url.encode())
+    cached_content = None
     # Check for cached file and try to return it
     if os.path.isfile(path):
         try:
@@ -55,16 +66,88 @@ def download_and_cache_url(
                     if datetime.timedelta(seconds=(now - timestamp)) <= cache_duration:
                         log.debug(f"Using cached '{path}' for '{url}'")
                         return f.read()
+                    cached_content = f.read()
+        except (OSError, ValueError) as e:
+            log.debug(f"{type(e).__name__}: {e}")
+
+    # Send the stored validators, if any, so the server can answer with just '304 Not Modified'
+    request_headers = {}
+    if cached_content is not None:
+        try:
+            with open(headers_path, encoding="utf-8") as f:
+                validators = json.load(f)
         except (OSError, ValueError) as e:
             log.debug(f"{type(e).__name__}: {e}")
+        else:
+            if validators.get("ETag"):
+                request_headers["If-None-Match"] = validators["ETag"]
+            if validators.get("Last-Modified"):
+                request_headers["If-Modified-Since"] = validators["Last-Modified"]
 
     # Download and cache the file
     log.debug(f"Downloading '{url}' to '{path}'")
-    content = download(url)
+    not_modified = False
+    try:
+        content, response_headers = download(url, request_headers)
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or cached_content is None:
+            raise
+        log.debug(f"'{url}' has not changed, refreshing the cached copy")
+        content = cached_content
+        not_modified = True
     os.makedirs(directory, exist_ok=True)
     temp_filename = f"{path}.{random.randrange(1 << 32):08x}.part"
     with open(temp_filename, "wb") as f:
         f.write(b"%s%d\n" % (prefix, now))
         f.write(content)
     os.replace(temp_filename, path)
+    if not not_modified:
+        validators = {
+            key: response_headers[key]
+            for key in ("ETag", "Last-Modified")
+            if response_headers.get(key)
+        }
+        temp_filename = f"{headers_path}.{random.randrange(1 << 32):08x}.part"
+        with open(temp_filename, "w", encoding="utf-8") as f:
+            json.dump(validators, f)
+        os.replace(temp_filename, headers_path)
     return content
+
+
+def parse_and_cache(url: str, content: bytes, parse: Callable[[bytes], Any]) -> Any:
+    """Applies `parse` to the content, stores the pickled result under ~/.cache/, and returns it.
+
+    The stored file sits alongside the URL cache entry and records the hash of the content it
+    was parsed from: when the content changes, the result is re-parsed and overwritten in
+    place (so no stale files accumulate); otherwise the (much cheaper) pickled result is
+    loaded instead.
+
+    Args:
+        url: The URL the content came from - determines the cache file name.
+        content: The raw bytes to be parsed.
+        parse: Callback that will accept the bytes and produce a picklable result.
+    """
+    directory = os.path.join(platformdirs.user_cache_dir("mkdocs"), "mkdocs_url_cache")
+    name_hash = hashlib.sha256(url.encode()).hexdigest()[:32]
+    path = os.path.join(directory, name_hash + ".pkl")
+    content_hash = hashlib.sha256(content).digest()
+
+    # Check for a cached parse result and try to return it
+    if os.path.isfile(path):
+        try:
+            with open(path, "rb") as f:
+                stored_hash, result = pickle.load(f)
+            if stored_hash == content_hash:
+                log.debug(f"Using cached parse result '{path}'")
+                return result
+        except (OSError, pickle.PickleError, EOFError, ValueError, TypeError) as e:
+            log.debug(f"{type(e).__name__}: {e}")
+
+    # Parse and cache the result
+    result = parse(content)
+    os.makedirs(directory, exist_ok=True)
+    temp_filename = f"{path}.{random.randrange(1 << 32):08x}.part"
+    with open(temp_filename, "wb") as f:
+        pickle.dump((content_hash, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_filename, path)
+    return result
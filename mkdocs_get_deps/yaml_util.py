@@ -31,6 +31,16 @@ YamlLoader.add_multi_constructor(
 )
 
 
+class CatalogLoader(SafeLoader):
+    pass
+
+
+# The projects catalog contains only strings, lists and dicts. Dropping the implicit
+# resolvers makes every scalar load as a plain string, skipping the per-scalar pattern
+# matching that the regular loader runs to detect ints, bools, dates etc.
+CatalogLoader.yaml_implicit_resolvers = {}
+
+
 def yaml_load(source: IO | str) -> dict[str, Any]:
     """Return dict of source YAML file using loader, recursively deep merging inherited parent."""
     result = yaml.load(source, Loader=YamlLoader)
@@ -0,0 +1,109 @@
+import datetime
+import os
+import tempfile
+import unittest
+import urllib.error
+from unittest import mock
+
+from mkdocs_get_deps import cache
+
+_FRESH = datetime.timedelta(days=1)
+_EXPIRED = datetime.timedelta(seconds=-1)
+
+
+class _TestWithCacheDir(unittest.TestCase):
+    def setUp(self):
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.cache_dir = os.path.join(tempdir.name, "mkdocs_url_cache")
+        patcher = mock.patch(
+            "mkdocs_get_deps.cache.platformdirs.user_cache_dir", return_value=tempdir.name
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestDownloadAndCacheUrl(_TestWithCacheDir):
+    url = "https://example.org/projects.yaml"
+
+    def test_revalidates_with_304(self):
+        requests = []
+
+        def download_v1(url, headers):
+            requests.append(dict(headers))
+            return b"v1", {"ETag": '"e1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+        content = cache.download_and_cache_url(self.url, _FRESH, download=download_v1)
+        self.assertEqual(b"v1", content)
+        # The first download sends no validators.
+        self.assertEqual({}, requests[0])
+
+        def download_304(url, headers):
+            requests.append(dict(headers))
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+
+        # Expired cache: the stored validators are sent, and 304 returns the cached bytes.
+        content = cache.download_and_cache_url(self.url, _EXPIRED, download=download_304)
+        self.assertEqual(b"v1", content)
+        self.assertEqual(
+            {"If-None-Match": '"e1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            requests[1],
+        )
+
+        def download_fail(url, headers):
+            raise AssertionError("The refreshed cache should be used without downloading")
+
+        # The 304 refreshed the cache timestamp, so the content is considered fresh again.
+        content = cache.download_and_cache_url(self.url, _FRESH, download=download_fail)
+        self.assertEqual(b"v1", content)
+
+    def test_changed_content_replaces_validators(self):
+        def download_v1(url, headers):
+            return b"v1", {"ETag": '"e1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+        cache.download_and_cache_url(self.url, _FRESH, download=download_v1)
+
+        def download_v2(url, headers):
+            return b"v2", {"ETag": '"e2"'}  # No Last-Modified in this response.
+
+        content = cache.download_and_cache_url(self.url, _EXPIRED, download=download_v2)
+        self.assertEqual(b"v2", content)
+
+        requests = []
+
+        def download_304(url, headers):
+            requests.append(dict(headers))
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+
+        content = cache.download_and_cache_url(self.url, _EXPIRED, download=download_304)
+        self.assertEqual(b"v2", content)
+        # Only the new response's validators remain; the old Last-Modified was dropped.
+        self.assertEqual({"If-None-Match": '"e2"'}, requests[0])
+
+
+class TestParseAndCache(_TestWithCacheDir):
+    url = "https://example.org/projects.yaml"
+
+    def _parse(self, content):
+        self.parse_calls.append(content)
+        return {"projects": [content.decode()]}
+
+    def setUp(self):
+        super().setUp()
+        self.parse_calls = []
+
+    def test_identical_content_skips_parse(self):
+        result = cache.parse_and_cache(self.url, b"one", self._parse)
+        self.assertEqual({"projects": ["one"]}, result)
+        result = cache.parse_and_cache(self.url, b"one", self._parse)
+        self.assertEqual({"projects": ["one"]}, result)
+        self.assertEqual([b"one"], self.parse_calls)
+
+    def test_changed_content_reparses_in_place(self):
+        cache.parse_and_cache(self.url, b"one", self._parse)
+        result = cache.parse_and_cache(self.url, b"two", self._parse)
+        self.assertEqual({"projects": ["two"]}, result)
+        self.assertEqual([b"one", b"two"], self.parse_calls)
+        # The old result is overwritten, not left behind as an orphan.
+        pickles = [name for name in os.listdir(self.cache_dir) if name.endswith(".pkl")]
+        self.assertEqual(1, len(pickles))
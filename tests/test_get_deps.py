@@ -28,6 +28,8 @@ class TestGetDeps(unittest.TestCase):
                 f.write(yml)
             with open(_projects_file_path, encoding="utf-8") as projects_file:
                 actual = get_deps(config_file=mkdocs_yml, projects_file=projects_file)
+            # The passed file is owned (and closed) by get_deps, on every path.
+            self.assertTrue(projects_file.closed)
         self.assertEqual(expected, actual)
 
     def test_empty_config(self):
@@ -127,6 +129,14 @@ class TestGetDeps(unittest.TestCase):
         """
         self._test_get_deps(cfg, ["mkdocs", "mkdocs-plugin-tags"])
 
+        cfg = """
+            theme: material
+            plugins:
+              - material/tags
+              - tags
+        """
+        self._test_get_deps(cfg, ["mkdocs", "mkdocs-material", "mkdocs-plugin-tags"])
+
     def test_nonexistent(self):
         cfg = """
             plugins:
@@ -155,6 +165,19 @@ class TestGetDeps(unittest.TestCase):
             cfg, ["git+https://github.com/andyoakley/mkdocs-blog", "mkdocs", "mkdocs-bootstrap4"]
         )
 
+    def test_uninstallable_fallthrough(self):
+        cfg = """
+            plugins:
+              - lightbox
+        """
+        expected_logs = """
+            ERROR:Can't find how to install plugin 'lightbox' although it was identified as .*
+        """
+        with self._assert_logs(expected_logs):
+            self._test_get_deps(
+                cfg, ["git+https://github.com/someone-else/mkdocs-lightbox", "mkdocs"]
+            )
+
     def test_multi_theme(self):
         cfg = """
             theme: minty